@@ -8,205 +8,77 @@ Two-tier filtering:
 """
 
 import requests
-import json
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import orjson
+from contextlib import contextmanager
+from dataclasses import dataclass
 from datetime import datetime
-from typing import List, Dict
+from typing import Callable, List, Dict, FrozenSet, Optional, Set, Tuple, Union
+from urllib.parse import urlparse
+import io
+import logging
+import os
+import re
+import stat
+import sys
+import tempfile
 import time
+from functools import lru_cache
+from itertools import groupby
+from operator import attrgetter
 import random
-
-
-class JobSearchAgent:
-    def __init__(self):
-        self.results = []
-        self.user_agents = [
-            'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-            'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/92.0.4515.107 Safari/537.36',
-            'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/14.1.2 Safari/605.1.15',
-            'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Edge/92.0.902.55',
-        ]
-
-    def _get_headers(self):
-        return {
-            "User-Agent": random.choice(self.user_agents),
-            "Accept": "application/json",
-        }
-
-    # ---------- GREENHOUSE ----------
-    def search_greenhouse_jobs(self) -> List[Dict]:
-        """Fetch Greenhouse job boards using the official Job Board API"""
-        jobs = []
-        print("Searching Greenhouse job boards...")
-
-        greenhouse_companies = [
-            "anthropic",
-            "figma",
-            "canva",
-            "discord",
-            "airtable",
-            "reddit",
-            "facebook",
-        ]
-
-        for company in greenhouse_companies:
-            try:
-                url = f"https://boards-api.greenhouse.io/v1/boards/{company}/jobs"
-                headers = self._get_headers()
-                headers["Referer"] = f"https://boards.greenhouse.io/{company}"
-
-                print(f"\nFetching: {url}")
-                response = requests.get(url, headers=headers, timeout=10)
-                print(f"Requested: {url}")
-                print(f"Final URL: {response.url}")
-                print(f"Status: {response.status_code}")
-
-                if response.status_code != 200:
-                    print(response.text[:300])
-                    continue
-
-                data = response.json()
-                job_posts = data.get("jobs", [])
-                print(f"   {company}: API working, {len(job_posts)} jobs listed")
-
-                found_count = 0
-                for job in job_posts:
-                    title = job.get("title", "")
-                    if not title:
-                        continue
-
-                    strict = self._matches_strict(title)
-                    wide = self._matches_wide(title)
-
-                    if not strict and not wide:
-                        continue
-
-                    location = (job.get("location") or {}).get("name", "Not specified")
-
-                    jobs.append(
-                        {
-                            "title": title,
-                            "company": company.title(),
-                            "location": location,
-                            "url": job.get("absolute_url", ""),
-                            "source": "Greenhouse",
-                            "posted_date": job.get("updated_at", "Recent"),
-                            "tier": "strict" if strict else "wide",
-                        }
-                    )
-                    found_count += 1
-
-                if found_count:
-                    print(f"   Found {found_count} matching/wide-net jobs")
-                time.sleep(1.5)
-
-            except Exception as e:
-                print(f"Error with Greenhouse/{company}: {e}")
-        return jobs
-
-    # ---------- LEVER ----------
-    def search_lever_jobs(self) -> List[Dict]:
-        """Fetch Lever job boards using Lever postings API"""
-        jobs = []
-        print("\nSearching Lever job boards...")
-
-        lever_companies = ["shopify", "grammarly", "retool", "plaid"]
-
-        for company in lever_companies:
-            try:
-                url = f"https://api.lever.co/v0/postings/{company}?mode=json"
-                headers = self._get_headers()
-                headers.pop("Accept", None)
-
-                print(f"\nFetching: {url}")
-                response = requests.get(url, headers=headers, timeout=10)
-                print(f"Requested: {url}")
-                print(f"Final URL: {response.url}")
-                print(f"Status: {response.status_code}")
-
-                if response.status_code != 200:
-                    print(response.text[:300])
-                    continue
-
-                job_posts = response.json()
-                print(f"   {company}: API working, {len(job_posts)} jobs listed")
-
-                found_count = 0
-                for job in job_posts:
-                    title = job.get("text", "")
-                    if not title:
-                        continue
-
-                    strict = self._matches_strict(title)
-                    wide = self._matches_wide(title)
-
-                    if not strict and not wide:
-                        continue
-
-                    categories = job.get("categories", {}) or {}
-                    location = categories.get("location", "Not specified")
-                    commitment = categories.get("commitment", "")
-
-                    jobs.append(
-                        {
-                            "title": title,
-                            "company": company.title(),
-                            "location": location,
-                            "type": commitment,
-                            "url": job.get("hostedUrl", ""),
-                            "source": "Lever",
-                            "posted_date": job.get("createdAt", "Recent"),
-                            "tier": "strict" if strict else "wide",
-                        }
-                    )
-                    found_count += 1
-
-                if found_count:
-                    print(f"   Found {found_count} matching/wide-net jobs")
-                time.sleep(1.5)
-            except Exception as e:
-                print(f"Error with Lever/{company}: {e}")
-        return jobs
-
-    # ---------- FILTERS ----------
-    def _matches_strict(self, title: str) -> bool:
-        """Strict filter: AI content / UX / prompt / design roles."""
-        title_lower = title.lower()
-        ai_keywords = ["ai", "artificial intelligence", "ml", "machine learning", "llm", "gpt", "claude"]
-        function_keywords = [
-            "prompt engineer",
-            "content engineer",
-            "ai content",
-            "ai writer",
-            "content strategist",
-            "ux",
-            "user experience",
-            "product design",
-            "interaction design",
-        ]
-        for kw in function_keywords:
-            if kw in title_lower:
-                if kw in ["ux", "user experience", "product design", "interaction design"]:
-                    return any(ai in title_lower for ai in ai_keywords)
-                return True
-        return False
-
-    def _matches_wide(self, title: str) -> bool:
-        """Wide-net filter: AI-related but product/UX/solutions adjacent, not deep ML infra."""
-        title_lower = title.lower()
-
-        wide_keywords = [
-            "ai",
-            "artificial intelligence",
-            "ml",
-            "machine learning",
-            "llm",
-            "gpt",
-            "genai",
-            "generative ai",
-        ]
-        if not any(kw in title_lower for kw in wide_keywords):
-            return False
-
-        role_anchor_keywords = [
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+log = logging.getLogger("jobsearch")
+
+
+def _any_of(keywords: List[str], whole_word: bool = False) -> "re.Pattern[str]":
+    """Compile keywords into one alternation so a title is scanned once per category."""
+    pattern = "|".join(map(re.escape, keywords))
+    if whole_word:
+        pattern = rf"\b(?:{pattern})\b"
+    return re.compile(pattern)
+
+
+# ---------- KEYWORDS ----------
+# AI terms match whole words only, so "ai" no longer fires inside "retail" or "email".
+# The AI words a substring match used to catch ("LLMs", "ChatGPT", "GenAI",
+# "OpenAI", "AIOps", "MLOps") are therefore listed explicitly; the only titles
+# dropped are ones like "Retail", "Email", "HTML" or "MLE" that merely contain
+# the letters.
+_AI_TERMS = [
+    "ai",
+    "artificial intelligence",
+    "genai",
+    "generative ai",
+    "openai",
+    "aiops",
+    "ml",
+    "mlops",
+    "machine learning",
+    "llm",
+    "llms",
+    "llmops",
+    "gpt",
+    "gpts",
+    "chatgpt",
+]
+# Function phrases match anywhere in the title, as substrings.
+_FUNCTION_PHRASES = ["prompt engineer", "content engineer", "ai content", "ai writer", "content strategist"]
+
+# Every title is scanned once per category; the strict and wide filters are
+# then decided from the set of categories that hit.
+_KEYWORD_CATEGORIES = {
+    "ai": _any_of(_AI_TERMS, whole_word=True),
+    # Claude counts as AI for strict UX titles, but not for the wide net.
+    "claude": _any_of(["claude"], whole_word=True),
+    "function": _any_of(_FUNCTION_PHRASES),
+    # UX-style titles only count as strict when they also mention AI.
+    "ux": _any_of(["ux", "user experience", "product design", "interaction design"]),
+    "anchor": _any_of(
+        [
             "product",
             "manager",
             "pm",
@@ -228,10 +100,9 @@ class JobSearchAgent:
             "collaboration",
             "human-ai",
         ]
-        if not any(anchor in title_lower for anchor in role_anchor_keywords):
-            return False
-
-        exclude_terms = [
+    ),
+    "exclude": _any_of(
+        [
             "fraud",
             "ads",
             "ranking",
@@ -246,112 +117,538 @@ class JobSearchAgent:
             "feature platform",
             "acceleration",
         ]
-        if any(ex in title_lower for ex in exclude_terms):
-            return False
-
-        return True
-
-    def _format_date(self, date_val) -> str:
-        """Prettify ISO or millisecond timestamps."""
-        if date_val in (None, ""):
-            return ""
-        if isinstance(date_val, (int, float)):
-            try:
-                dt = datetime.fromtimestamp(date_val / 1000.0)
-                return dt.strftime("%b %d, %Y").replace(" 0", " ")
-            except Exception:
-                return str(date_val)
-        if isinstance(date_val, str):
-            if date_val == "Recent":
-                return "Recent"
-            try:
-                ds = date_val.replace("Z", "+00:00")
-                dt = datetime.fromisoformat(ds)
-                return dt.strftime("%b %d, %Y").replace(" 0", " ")
-            except Exception:
-                return date_val
-        return str(date_val)
+    ),
+}
+
+
+# Every strict or wide match needs a function phrase or an AI term, so a title
+# with none of their first words can be rejected before the full scan. The set
+# is derived from the lists above and follows any keyword edit.
+# Known gap: function phrases match as substrings, but the prefilter wants the
+# first word as a whole token, so a phrase glued inside a longer word (e.g.
+# "thai writer" containing "ai writer") is rejected here.
+_TOKEN_SPLIT = re.compile(r"\W+")
+_PREFILTER_TOKENS = frozenset(
+    _TOKEN_SPLIT.split(phrase)[0] for phrase in _AI_TERMS + ["claude"] + _FUNCTION_PHRASES
+)
+
+
+# ---------- FILTERS ----------
+# Titles repeat heavily across boards, so the scan is memoized per title.
+@lru_cache(maxsize=8192)
+def _keyword_hits(title_lower: str) -> FrozenSet[str]:
+    """Return every keyword category the (already lowercased) title hits."""
+    return frozenset(
+        category for category, pattern in _KEYWORD_CATEGORIES.items() if pattern.search(title_lower)
+    )
+
+
+def _matches_strict(title_lower: str) -> bool:
+    """Strict filter: AI content / UX / prompt / design roles."""
+    hits = _keyword_hits(title_lower)
+    return "function" in hits or ("ux" in hits and ("ai" in hits or "claude" in hits))
+
+
+def _matches_wide(title_lower: str) -> bool:
+    """Wide-net filter: AI-related but product/UX/solutions adjacent, not deep ML infra."""
+    hits = _keyword_hits(title_lower)
+    return "ai" in hits and "anchor" in hits and "exclude" not in hits
+
+
+def _classify(title_lower: str) -> Optional[str]:
+    """Return the title's tier: "strict", "wide", or None if it matches neither.
+
+    Callers lowercase the title once and reuse it for the dedup key as well.
+    """
+    # Most titles on a general board mention none of these words, so they are
+    # rejected here without the full scan (or a slot in its cache).
+    if _PREFILTER_TOKENS.isdisjoint(_TOKEN_SPLIT.split(title_lower)):
+        return None
+    if _matches_strict(title_lower):
+        return "strict"
+    if _matches_wide(title_lower):
+        return "wide"
+    return None
+
+
+# ---------- RATE LIMITING ----------
+# Board fetches share one small thread pool. PER_HOST_CONCURRENCY caps in-flight
+# requests per host and sizes each host's connection pool to match.
+MAX_WORKERS = 8
+PER_HOST_CONCURRENCY = 4
+# Requests started per second against any one host, with bursts up to the same size.
+PER_HOST_RATE = 5
+# Longest Retry-After wait honoured between retries. A board asking for more
+# is retried sooner, and if it still refuses the stale-cache fallback applies.
+MAX_RETRY_AFTER = 10
+
+
+class TokenBucket:
+    """Thread-safe token bucket allowing `rate` requests per `per` seconds."""
+
+    def __init__(self, rate: float, per: float):
+        self.rate = rate
+        self.per = per
+        self._tokens = rate
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a token is available, then take it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                refill = (now - self._updated) * self.rate / self.per
+                self._tokens = min(self.rate, self._tokens + refill)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) * self.per / self.rate
+            time.sleep(wait)
+
+
+class CappedRetry(Retry):
+    """Retry that never sleeps longer than MAX_RETRY_AFTER for a Retry-After header.
+
+    urllib3 sleeps for whatever the server asks, while the host's semaphore is
+    held; an hour-long Retry-After would otherwise stall the whole run.
+    """
+
+    def get_retry_after(self, response) -> Optional[float]:
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, MAX_RETRY_AFTER)
+
+
+# ---------- JOBS ----------
+@dataclass(slots=True, frozen=True)
+class Job:
+    """One matching posting. orjson serializes it directly for the JSON output.
+
+    Records are immutable: dedup swaps in the strict record rather than editing one.
+    """
+
+    title: str
+    company: str
+    location: str
+    url: str
+    source: str
+    posted_date: Union[str, int]
+    tier: str
+    type: str = ""
+
+
+# ---------- DATES ----------
+def _day_label(dt: datetime) -> str:
+    return f"{dt:%b} {dt.day}, {dt.year}"
+
+
+# Many jobs share a posted date (or "Recent"), so each distinct value is formatted once.
+@lru_cache(maxsize=2048)
+def _format_date(date_val) -> str:
+    """Prettify ISO or millisecond timestamps."""
+    if date_val in (None, ""):
+        return ""
+    if isinstance(date_val, (int, float)):
+        try:
+            return _day_label(datetime.fromtimestamp(date_val / 1000.0))
+        except Exception:
+            return str(date_val)
+    if isinstance(date_val, str):
+        if date_val == "Recent":
+            return "Recent"
+        try:
+            return _day_label(datetime.fromisoformat(date_val.replace("Z", "+00:00")))
+        except Exception:
+            return date_val
+    return str(date_val)
+
+
+# ---------- CACHE ----------
+# Boards fetched within this window are served from job_cache.json without
+# asking the host at all; older entries are revalidated with a conditional GET.
+CACHE_MAX_AGE = 60 * 60
+# When a board is down or rate-limited, a cached listing up to this old stands
+# in for it; anything older is dropped rather than reported as current.
+CACHE_STALE_MAX_AGE = 24 * 60 * 60
+
+
+# ---------- OUTPUT ----------
+def _target_mode(path: str) -> int:
+    """Permission bits a plain open(path, "w") would leave path with."""
+    try:
+        return stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+
+@contextmanager
+def _atomic_open(path: str, mode: str = "wb", **kwargs):
+    """Open a temp file beside path for writing; rename it into place on success.
+
+    Readers (and the next run's cache load) never see a half-written file.
+    The result keeps the mode of the file it replaces, or gets the usual
+    umask-based mode for a new file, rather than the temp file's 0600.
+    """
+    tmp = tempfile.NamedTemporaryFile(
+        mode, dir=os.path.dirname(os.path.abspath(path)), delete=False, **kwargs
+    )
+    try:
+        with tmp:
+            yield tmp
+        os.chmod(tmp.name, _target_mode(path))
+        os.replace(tmp.name, path)
+    except BaseException:
+        os.unlink(tmp.name)
+        raise
+
+
+# ---------- BOARD PAYLOADS ----------
+def _board_url(company: str, source: str) -> str:
+    """Return the public JSON endpoint for a company's board."""
+    if source == "Greenhouse":
+        return f"https://boards-api.greenhouse.io/v1/boards/{company}/jobs"
+    return f"https://api.lever.co/v0/postings/{company}?mode=json"
+
+
+def _greenhouse_postings(data: Dict) -> List[Dict]:
+    """Reduce a Greenhouse board payload to the fields the agent reports on."""
+    return [
+        {
+            "title": job["title"],
+            "location": (job.get("location") or {}).get("name", "Not specified"),
+            "url": job.get("absolute_url", ""),
+            "posted_date": job.get("updated_at", "Recent"),
+        }
+        for job in data.get("jobs", [])
+        if job.get("title")
+    ]
 
-    # ---------- MAIN RUN ----------
-    def search_all(self) -> List[Dict]:
-        print("Starting AI Job Search Agent...\n")
-        all_jobs = self.search_greenhouse_jobs() + self.search_lever_jobs()
 
-        seen = {}
-        for job in all_jobs:
-            key = (job["title"].lower(), job["company"].lower())
-            existing = seen.get(key)
-            if not existing:
-                seen[key] = job
-            elif existing.get("tier") == "wide" and job.get("tier") == "strict":
-                seen[key] = job
+def _lever_posting(job: Dict) -> Dict:
+    """Reduce one Lever posting to the fields the agent reports on."""
+    categories = job.get("categories") or {}
+    return {
+        "title": job["text"],
+        "location": categories.get("location", "Not specified"),
+        "type": categories.get("commitment", ""),
+        "url": job.get("hostedUrl", ""),
+        "posted_date": job.get("createdAt", "Recent"),
+    }
 
-        self.results = list(seen.values())
-        return self.results
 
-    def generate_report(self, jobs: List[Dict]) -> str:
-        strict_jobs = [j for j in jobs if j.get("tier") == "strict"]
-        wide_jobs = [j for j in jobs if j.get("tier") == "wide"]
+def _lever_postings(data: List[Dict]) -> List[Dict]:
+    """Reduce a Lever postings payload to the fields the agent reports on."""
+    return [_lever_posting(job) for job in data if job.get("text")]
 
-        lines = [
-            "=" * 80,
-            f"AI JOB SEARCH RESULTS - {datetime.now().strftime('%B %d, %Y')}",
-            "=" * 80,
-            f"\nFound {len(strict_jobs)} strict-match roles and {len(wide_jobs)} wider-net roles ({len(jobs)} total).\n",
+
+class JobSearchAgent:
+    def __init__(self):
+        self.results = []
+        self.user_agents = [
+            'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+            'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/92.0.4515.107 Safari/537.36',
+            'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/14.1.2 Safari/605.1.15',
+            'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Edge/92.0.902.55',
         ]
+        self.greenhouse_companies = [
+            "anthropic",
+            "figma",
+            "canva",
+            "discord",
+            "airtable",
+            "reddit",
+            "facebook",
+        ]
+        self.lever_companies = ["shopify", "grammarly", "retool", "plaid"]
+        # One pooled session so each board host reuses its TCP/TLS connection.
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=PER_HOST_CONCURRENCY,
+            # Transient 429/5xx answers are retried with backoff (honouring a
+            # capped Retry-After); if they persist the last response is
+            # returned and reported instead of raising.
+            max_retries=CappedRetry(
+                total=3,
+                backoff_factor=0.7,
+                status_forcelist=[429, 500, 502, 503, 504],
+                respect_retry_after_header=True,
+                raise_on_status=False,
+            ),
+        )
+        self.session = requests.Session()
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        # Board responses from the last run, keyed by URL, for conditional GETs.
+        self.cache_file = "job_cache.json"
+        self._cache = self._load_cache()
+        # Boards whose jobs this run came from a cached listing after a failed fetch.
+        self.stale_boards: Set[str] = set()
+        self._limits = {}
+        self._limits_lock = threading.Lock()
+
+    def _get_headers(self):
+        return {
+            "User-Agent": random.choice(self.user_agents),
+            "Accept": "application/json",
+        }
+
+    def _host_limits(self, url: str) -> Tuple[threading.Semaphore, "TokenBucket"]:
+        """Return the (concurrency, rate) limits shared by every request to url's host."""
+        host = urlparse(url).hostname
+        with self._limits_lock:
+            if host not in self._limits:
+                self._limits[host] = (
+                    threading.Semaphore(PER_HOST_CONCURRENCY),
+                    TokenBucket(rate=PER_HOST_RATE, per=1.0),
+                )
+            return self._limits[host]
+
+    # ---------- CACHE ----------
+    def _load_cache(self) -> Dict:
+        """Load cached board responses; a missing or corrupt cache starts empty."""
+        try:
+            with open(self.cache_file, "rb") as cf:
+                cache = orjson.loads(cf.read())
+        except (OSError, ValueError):
+            return {}
+        return cache if isinstance(cache, dict) else {}
+
+    def _save_cache(self, keep_urls: Set[str]):
+        """Persist the cache, dropping boards that are no longer searched so it stays bounded."""
+        self._cache = {url: entry for url, entry in self._cache.items() if url in keep_urls}
+        with _atomic_open(self.cache_file) as cf:
+            cf.write(orjson.dumps(self._cache))
+
+    # ---------- FETCH ----------
+    def _board_postings(self, company: str, source: str) -> Optional[List[Dict]]:
+        """Return a board's postings from the cache or the network; None if unavailable."""
+        url = _board_url(company, source)
+        headers = self._get_headers()
+        if source == "Greenhouse":
+            headers["Referer"] = f"https://boards.greenhouse.io/{company}"
+        else:
+            headers.pop("Accept", None)
+
+        cached = self._cache.get(url)
+        if not isinstance(cached, dict) or "postings" not in cached:
+            cached = None
+        if cached and time.time() - cached.get("fetched_at", 0) < CACHE_MAX_AGE:
+            log.info("   %s: fetched recently, using cached listing", company)
+            return cached["postings"]
+
+        # Ask the board to answer 304 Not Modified if nothing changed since last run.
+        if cached:
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
+
+        try:
+            log.debug("Fetching: %s", url)
+            # Per-host limits keep us polite to each job board while requests
+            # to unrelated hosts proceed in parallel.
+            semaphore, bucket = self._host_limits(url)
+            with semaphore:
+                bucket.acquire()
+                response = self.session.get(url, headers=headers, timeout=10)
+            log.debug("Requested: %s | Final URL: %s | Status: %s", url, response.url, response.status_code)
+
+            if response.status_code == 304 and cached:
+                log.info("   %s: unchanged since last run, using cached listing", company)
+                cached["fetched_at"] = time.time()
+                return cached["postings"]
+            if response.status_code == 200:
+                # Keep only the fields we use; the raw payload is dropped right away.
+                data = orjson.loads(response.content)
+                if source == "Greenhouse":
+                    postings = _greenhouse_postings(data)
+                else:
+                    postings = _lever_postings(data)
+                self._cache[url] = {
+                    "etag": response.headers.get("ETag"),
+                    "last_modified": response.headers.get("Last-Modified"),
+                    "fetched_at": time.time(),
+                    "postings": postings,
+                }
+                return postings
+
+            log.warning("   %s: board unavailable (status %s)", company, response.status_code)
+            # Decoding the body is not free, so only do it when it will be shown.
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("%s", response.text[:300])
+            # Only outages and rate limits are worth waiting out; a 404 or 403
+            # means the board itself is gone, so its old listing is not shown.
+            if response.status_code != 429 and response.status_code < 500:
+                return None
+        except Exception as e:
+            log.warning("Error with %s/%s: %s", source, company, e)
+            # Connection errors and timeouts fall back; a malformed payload does not.
+            if not isinstance(e, requests.RequestException):
+                return None
+
+        # Rather than drop the board for this run, fall back to its last good listing.
+        if not cached:
+            return None
+        age = time.time() - cached.get("fetched_at", 0)
+        if age > CACHE_STALE_MAX_AGE:
+            log.info("   %s: cached listing is %d hours old, not using it", company, age // 3600)
+            return None
+        log.info("   %s: using cached listing from the last successful fetch", company)
+        self.stale_boards.add(company.title())
+        return cached["postings"]
+
+    def _fetch_board(self, company: str, source: str) -> List[Tuple[Tuple[str, str], Job]]:
+        """Fetch one Greenhouse or Lever board and return its matching jobs.
+
+        Each job comes paired with its (title, company) dedup key, lowercased.
+        """
+        jobs = []
+        postings = self._board_postings(company, source)
+        if postings is None:
+            return jobs
+        company_name = company.title()
+        company_lower = company_name.lower()
+        # A malformed posting drops this board only, never the whole search.
+        try:
+            log.info("   %s: %d jobs listed", company, len(postings))
+            for posting in postings:
+                title_lower = posting["title"].lower()
+                tier = _classify(title_lower)
+                if tier is None:
+                    continue
 
-        lines.append("\nSTRICT MATCH ROLES (AI content / UX / prompt / design)")
-        lines.append("-" * 80)
-        lines.extend(self._render_jobs(strict_jobs))
+                job = Job(
+                    title=posting["title"],
+                    company=company_name,
+                    location=posting["location"],
+                    url=posting["url"],
+                    source=source,
+                    posted_date=posting["posted_date"],
+                    tier=tier,
+                    type=posting.get("type", ""),
+                )
+                jobs.append(((title_lower, company_lower), job))
+        except Exception as e:
+            log.warning("Error with %s/%s: %s", source, company, e)
+            return []
 
-        lines.append("\nOTHER AI ROLES (WIDER NET)")
-        lines.append("-" * 80)
-        lines.extend(self._render_jobs(wide_jobs))
+        if jobs:
+            log.info("   %s: found %d matching/wide-net jobs", company, len(jobs))
+        return jobs
 
-        lines.append("=" * 80)
-        lines.append(f"Total: {len(jobs)} jobs found")
-        lines.append("=" * 80)
-        return "\n".join(lines)
+    # ---------- MAIN RUN ----------
+    def search_all(self) -> List[Job]:
+        log.info("Starting AI Job Search Agent...\n")
+        self.stale_boards = set()
+        tasks = [(c, "Greenhouse") for c in self.greenhouse_companies]
+        tasks += [(c, "Lever") for c in self.lever_companies]
+
+        # Dedup each board's jobs as soon as it is collected; boards are read in
+        # submission order so the output stays stable from run to run.
+        seen = {}
+        with ThreadPoolExecutor(max_workers=max(1, min(MAX_WORKERS, len(tasks)))) as pool:
+            futures = [pool.submit(self._fetch_board, company, source) for company, source in tasks]
+            for future in futures:
+                for key, job in future.result():
+                    existing = seen.get(key)
+                    if not existing:
+                        seen[key] = job
+                    elif existing.tier == "wide" and job.tier == "strict":
+                        seen[key] = job
 
-    def _render_jobs(self, job_list: List[Dict]) -> List[str]:
+        self.results = list(seen.values())
+        self._save_cache({_board_url(company, source) for company, source in tasks})
+        return self.results
+
+    def generate_report(self, jobs: List[Job]) -> str:
+        buf = io.StringIO()
+        self._write_report(buf.write, jobs)
+        return buf.getvalue()
+
+    def _write_report(self, w: Callable[[str], int], jobs: List[Job]):
+        """Write the full text report through the writer w."""
+        # Sort once by (company, title); splitting by tier keeps that order, so
+        # each tier's company blocks come out ready for groupby.
+        tiers = {"strict": [], "wide": []}
+        for j in sorted(jobs, key=attrgetter("company", "title")):
+            tiers[j.tier].append(j)
+        strict_count = len(tiers["strict"])
+        wide_count = len(tiers["wide"])
+
+        rule = "=" * 80
+        w(f"{rule}\nAI JOB SEARCH RESULTS - {datetime.now().strftime('%B %d, %Y')}\n{rule}\n")
+        w(f"\nFound {strict_count} strict-match roles and {wide_count} wider-net roles ({len(jobs)} total).\n")
+        if self.stale_boards:
+            w(f"Could not reach {', '.join(sorted(self.stale_boards))}; their roles come from an earlier cached listing.\n")
+        w("\n")
+
+        w("\nSTRICT MATCH ROLES (AI content / UX / prompt / design)\n")
+        w("-" * 80 + "\n")
+        self._render_jobs(w, tiers["strict"])
+
+        w("\nOTHER AI ROLES (WIDER NET)\n")
+        w("-" * 80 + "\n")
+        self._render_jobs(w, tiers["wide"])
+
+        w(f"{rule}\nTotal: {len(jobs)} jobs found\n{rule}")
+
+    def _render_jobs(self, w: Callable[[str], int], job_list: List[Job]):
+        """Write one tier's jobs, already sorted by (company, title), through the writer w."""
         if not job_list:
-            return ["No roles found.\n"]
-        grouped = {}
-        for j in job_list:
-            grouped.setdefault(j["company"], []).append(j)
-
-        lines = []
-        for company, lst in sorted(grouped.items()):
-            lines.append(f"\n{'─'*80}\n{company.upper()}\n{'─'*80}")
-            for j in lst:
-                lines.append(f"• {j['title']}")
-                lines.append(f"   Location: {j['location']}")
-                if j.get("type"):
-                    lines.append(f"   Type: {j['type']}")
-                formatted_date = self._format_date(j.get("posted_date"))
+            w("No roles found.\n\n")
+            return
+
+        rule = "─" * 80
+        for company, group in groupby(job_list, key=attrgetter("company")):
+            w(f"\n{rule}\n{company.upper()}\n{rule}\n")
+            for j in group:
+                w(f"• {j.title}\n")
+                w(f"   Location: {j.location}\n")
+                if j.type:
+                    w(f"   Type: {j.type}\n")
+                formatted_date = _format_date(j.posted_date)
                 if formatted_date:
-                    lines.append(f"   Posted: {formatted_date}")
-                lines.append(f"   Apply: {j['url']}")
-                lines.append("")
-        return lines
+                    w(f"   Posted: {formatted_date}\n")
+                w(f"   Apply: {j.url}\n\n")
 
-    def save_results(self):
+    def save_results(self, report: Optional[str] = None):
+        """Write the JSON results and the text report.
+
+        Pass the report already rendered for display to reuse it; otherwise
+        it is rendered straight to disk.
+        """
         ts = datetime.now().strftime("%Y%m%d_%H%M%S")
         jsf, txtf = f"job_results_{ts}.json", f"job_results_{ts}.txt"
-        with open(jsf, "w") as jf:
-            json.dump({"jobs": self.results}, jf, indent=2)
-        with open(txtf, "w") as tf:
-            tf.write(self.generate_report(self.results))
+        payload = {
+            "search_date": datetime.now().isoformat(),
+            "total_jobs": len(self.results),
+            "stale_boards": sorted(self.stale_boards),
+            "jobs": self.results,
+        }
+        with _atomic_open(jsf) as jf:
+            jf.write(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+        with _atomic_open(txtf, "w", encoding="utf-8") as tf:
+            if report is None:
+                self._write_report(tf.write, self.results)
+            else:
+                tf.write(report)
         print(f"\nResults saved to {jsf}\nReport saved to {txtf}")
 
 
 def main():
+        logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
         agent = JobSearchAgent()
         jobs = agent.search_all()
-        print("\n" + agent.generate_report(jobs))
-        agent.save_results()
+        report = agent.generate_report(jobs)
+        print("\n" + report)
+        agent.save_results(report)
         if jobs:
-            print(f"\nQuick Summary: {len(jobs)} jobs across {len(set(j['company'] for j in jobs))} companies")
+            print(f"\nQuick Summary: {len(jobs)} jobs across {len(set(j.company for j in jobs))} companies")
         else:
             print("\nRun this daily to catch new postings!")
 